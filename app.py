@@ -4,14 +4,23 @@
 Rewritten to avoid PySimpleGUI compatibility issues on some systems.
 Uses Tkinter for the GUI (stdlib) and python-vlc for playback.
 """
+import hashlib
 import json
 import os
+import random
+import re
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import sys
 import threading
 import time
 import tkinter as tk
 from tkinter import ttk, messagebox
+from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     import vlc
@@ -20,118 +29,289 @@ except Exception as e:
     print("Exception:", e)
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    # optional: faster JSON encode/decode, falls back to the stdlib json module
+    orjson = None
+
 
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 STATIONS_FILE = os.path.join(APP_DIR, "stations.json")
+RESOLVE_CACHE_FILE = os.path.join(APP_DIR, "resolve_cache.json")
+RESOLVE_CACHE_TTL = 24 * 60 * 60  # seconds
+STREAM_HOSTS_FILE = os.path.join(APP_DIR, "stream_hosts.json")
+
+_PLAYLIST_URL_RE = re.compile(rb"(?m)^\s*(https?://\S+)")
+# bytes of a playlist body requested and scanned when resolving a URL
+PLAYLIST_SAMPLE_SIZE = 4096
+
+# Shared HTTP session so Radio Browser searches and playlist probes reuse
+# keep-alive connections instead of doing a new TCP/TLS handshake each call.
+# (connect, read) timeout: an unreachable host fails after ~2 s per attempt
+# instead of a flat 10 s.
+HTTP_TIMEOUT = (2, 8)
+# Retry one failed connect and 502/503/504 answers, but never a read timeout:
+# a server that accepts but never answers would otherwise cost 3 x 8 s.
+_retry = Retry(total=2, connect=1, read=0, backoff_factor=0.3,
+               status_forcelist=(502, 503, 504), allowed_methods=("GET", "HEAD"))
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(max_retries=_retry, pool_connections=10, pool_maxsize=20))
+SESSION.mount("http://", HTTPAdapter(max_retries=_retry, pool_connections=10, pool_maxsize=20))
+SESSION.headers["User-Agent"] = "SimpleRadio/1.0"
+# requests advertises "br" in Accept-Encoding automatically when the brotli
+# package is installed (see requirements.txt), on top of gzip/deflate.
+
+# url -> [resolved_url, timestamp]; persisted to RESOLVE_CACHE_FILE between runs
+_resolve_cache = {}
+# host -> timestamp of the last probe that answered with a (non-playlist)
+# audio content-type; URLs on them are assumed to be direct streams for
+# RESOLVE_CACHE_TTL seconds. Persisted to STREAM_HOSTS_FILE between runs.
+_host_is_audio = {}
+# audio/* content-types that are playlists, not streams
+_PLAYLIST_TYPES = ("audio/x-mpegurl", "audio/mpegurl", "audio/x-scpls", "audio/scpls")
+
+
+def json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent=False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes (non-ASCII kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def write_file_atomic(path, data: bytes):
+    # write to a temp file and swap it in so a crash never leaves a truncated file
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
 
 
 def load_stations(path):
     if not os.path.exists(path):
         return []
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = json_loads(f.read())
     return data
 
 
-def resolve_playlist(url, timeout=10):
+def load_resolve_cache(path):
+    """Load cached playlist resolutions, dropping entries older than the TTL."""
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, "rb") as f:
+            data = json_loads(f.read())
+        now = time.time()
+        for url, (resolved, ts) in data.items():
+            if now - ts < RESOLVE_CACHE_TTL:
+                _resolve_cache[url] = [resolved, ts]
+    except Exception as e:
+        # a corrupt or unexpected cache file is simply ignored
+        print(f"[debug] failed to load resolve cache: {e}")
+
+
+def save_resolve_cache(path):
+    try:
+        write_file_atomic(path, json_dumps(_resolve_cache))
+    except Exception as e:
+        print(f"[debug] failed to save resolve cache: {e}")
+
+
+def load_stream_hosts(path):
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, "rb") as f:
+            data = json_loads(f.read())
+        now = time.time()
+        for host, ts in data.items():
+            if now - ts < RESOLVE_CACHE_TTL:
+                _host_is_audio[host] = ts
+    except Exception as e:
+        print(f"[debug] failed to load stream hosts: {e}")
+
+
+def save_stream_hosts(path):
+    try:
+        write_file_atomic(path, json_dumps(_host_is_audio))
+    except Exception as e:
+        print(f"[debug] failed to save stream hosts: {e}")
+
+
+def resolve_playlist(url, timeout=HTTP_TIMEOUT):
     """Try to resolve a playlist (m3u/pls) to an actual stream URL.
 
     Returns the resolved URL or the original URL if it looks like an audio stream.
+    Results are cached for RESOLVE_CACHE_TTL seconds.
     """
     # Fast heuristics: known stream extensions -> return immediately
+    if url.endswith((".mp3", ".aac", ".m3u8", ".pls", ".m3u")):
+        return url
+
+    now = time.time()
+    hit = _resolve_cache.get(url)
+    if hit is not None and now - hit[1] < RESOLVE_CACHE_TTL:
+        return hit[0]
+
     try:
-        if url.endswith((".mp3", ".aac", ".m3u8", ".pls", ".m3u")):
+        host = urlparse(url).netloc
+        ts = _host_is_audio.get(host)
+        if ts is not None and now - ts < RESOLVE_CACHE_TTL:
+            return url
+        resolved = _probe_playlist(url, host, timeout)
+    except Exception:
+        # Malformed URLs, network and HTTP errors are not cached so the next attempt tries again
+        return url
+    _resolve_cache[url] = [resolved, time.time()]
+    return resolved
+
+
+def _probe_playlist(url, host, timeout):
+    # Single streamed GET: the headers give us the content-type and, for
+    # playlists, the first few KB of body are enough to find an entry.
+    with SESSION.get(url, timeout=timeout, allow_redirects=True, stream=True,
+                     headers={"Range": f"bytes=0-{PLAYLIST_SAMPLE_SIZE - 1}"}) as r:
+        # 4xx/5xx must not look like "no playlist entry" (206 is fine: ranged request)
+        r.raise_for_status()
+        content_type = (r.headers.get("content-type", "") or "").split(";")[0].strip().lower()
+
+        # If content-type indicates audio (stream), return original URL;
+        # playlist types such as audio/x-mpegurl fall through to the body scan
+        if "audio" in content_type and content_type not in _PLAYLIST_TYPES:
+            _host_is_audio[host] = time.time()
             return url
 
-        # Try a HEAD first to obtain content-type without downloading body.
-        content_type = ""
-        r = None
-        try:
-            r = requests.head(url, timeout=timeout, allow_redirects=True)
-            content_type = r.headers.get("content-type", "") or ""
-        except Exception:
-            # Some servers don't support HEAD properly; fall back to a streamed GET
-            try:
-                r = requests.get(url, timeout=timeout, allow_redirects=True, stream=True)
-                content_type = r.headers.get("content-type", "") or ""
-            except Exception:
-                return url
+        # Scan a small sample of the body for the first http(s) entry;
+        # comment lines (#EXTM3U, #EXTINF...) never match the pattern.
+        m = _PLAYLIST_URL_RE.search(r.raw.read(PLAYLIST_SAMPLE_SIZE, decode_content=True))
+        if m:
+            return m.group(1).decode("utf-8", "replace")
 
-        # If content-type indicates audio (stream), return original URL
-        if "audio" in content_type.lower() or url.endswith((".mp3", ".aac", ".m3u8")):
-            try:
-                if r is not None:
-                    r.close()
-            except Exception:
-                pass
-            return url
+    # If we couldn't find a redirect inside a small sample, assume original URL is the stream
+    return url
 
-        # Otherwise, attempt to read only a small amount of the response (playlist files)
-        try:
-            if r is None or not getattr(r, "iter_lines", None):
-                r = requests.get(url, timeout=timeout, allow_redirects=True, stream=True)
-
-            # Read up to a limited number of lines to find first http(s) entry
-            max_lines = 64
-            lines_read = 0
-            for raw in r.iter_lines(decode_unicode=True):
-                if raw is None:
-                    continue
-                line = raw.strip()
-                lines_read += 1
-                if not line or line.startswith("#"):
-                    pass
-                elif line.startswith("http://") or line.startswith("https://"):
-                    return line
-                if lines_read >= max_lines:
-                    break
-        except Exception:
-            # If anything goes wrong while inspecting, just return original URL
-            return url
-        finally:
-            try:
-                if r is not None:
-                    r.close()
-            except Exception:
-                pass
 
-        # If we couldn't find a redirect inside a small sample, assume original URL is the stream
-        return url
-    except Exception:
-        return url
+RB_DEFAULT_HOST = "all.api.radio-browser.info"
+_RB_FIELDS = ("name", "country", "url", "url_resolved", "tags")
+
+
+@lru_cache(maxsize=128)
+def _rb_search(host, query, mode):
+    """Search Radio Browser stations by a single field (name/tag/country/language).
+
+    Results are memoized per (host, query, mode); call _rb_search.cache_clear() to refresh.
+    """
+    params = {mode: query, "limit": 50, "hidebroken": True}
+    r = SESSION.get(f"https://{host}/json/stations/search", params=params, timeout=HTTP_TIMEOUT)
+    r.raise_for_status()
+    # Keep only the fields the UI uses; the full Radio Browser record is large
+    # and would otherwise be held in the LRU cache. Every field is present in
+    # the trimmed dict, with "(no name)" standing in for a missing name.
+    items = []
+    for obj in json_loads(r.content):
+        it = {k: obj.get(k) or "" for k in _RB_FIELDS}
+        it["name"] = it["name"] or "(no name)"
+        items.append(it)
+    return tuple(items)
+
+
+def pick_rb_host():
+    """Pick one Radio Browser mirror for the session.
+
+    The round-robin name resolves to every mirror; reverse DNS on one of the
+    addresses gives a stable host name (e.g. de1.api.radio-browser.info) so
+    successive searches can reuse one keep-alive connection. Names outside
+    api.radio-browser.info would fail the TLS check, so those are rejected.
+    """
+    try:
+        _, _, addrs = socket.gethostbyname_ex(RB_DEFAULT_HOST)
+        host, _, _ = socket.gethostbyaddr(random.choice(addrs))
+        if host.endswith(".api.radio-browser.info"):
+            return host
+        print(f"[debug] ignoring unexpected mirror name: {host}")
+        return RB_DEFAULT_HOST
+    except Exception as e:
+        print(f"[debug] mirror lookup failed: {e}")
+        return RB_DEFAULT_HOST
 
 
 class RadioPlayer:
     def __init__(self):
-        self.instance = vlc.Instance()
-        self.player = self.instance.media_player_new()
+        self.instance = None
+        self.player = None
         self.current_url = None
         self.playing = False
+        self.volume = None
+        # optional callback(playing: bool), invoked from libvlc's event thread
+        self.on_state = None
+        # vlc.Instance() scans plugins and can take a while, so create it off
+        # the GUI thread; play() waits until it is ready.
+        self._ready = threading.Event()
+        self._state_changed = threading.Event()
+        threading.Thread(target=self._init_vlc, daemon=True).start()
+
+    def _init_vlc(self):
+        try:
+            self.instance = vlc.Instance()
+            self.player = self.instance.media_player_new()
+            em = self.player.event_manager()
+            em.event_attach(vlc.EventType.MediaPlayerPlaying, lambda e: self._set_playing(True))
+            em.event_attach(vlc.EventType.MediaPlayerEncounteredError, lambda e: self._set_playing(False))
+            em.event_attach(vlc.EventType.MediaPlayerEndReached, lambda e: self._set_playing(False))
+            if self.volume is not None:
+                self.player.audio_set_volume(self.volume)
+        except Exception as e:
+            print(f"[debug] libvlc init failed: {e}")
+        finally:
+            self._ready.set()
+
+    def play(self, url, timeout=5):
+        """Start playing url and wait until libvlc reports Playing or an error.
 
-    def play(self, url):
+        Returns after at most timeout seconds; later state changes are still
+        delivered through on_state.
+        """
+        self._ready.wait()
         try:
             if self.playing:
                 self.stop()
             media = self.instance.media_new(url)
             self.player.set_media(media)
-            self.player.play()
-            # small delay to allow state to change
-            time.sleep(0.1)
             self.current_url = url
             self.playing = True
+            self._state_changed.clear()
+            self.player.play()
         except Exception:
             self.playing = False
+            return
+        self._state_changed.wait(timeout)
+
+    def _set_playing(self, playing):
+        self.playing = playing
+        self._state_changed.set()
+        if self.on_state is not None:
+            self.on_state(playing)
 
     def stop(self):
         try:
-            self.player.stop()
+            if self.player is not None:
+                self.player.stop()
         finally:
             self.playing = False
             self.current_url = None
 
     def set_volume(self, v: int):
+        self.volume = int(v)
         try:
-            self.player.audio_set_volume(int(v))
+            if self.player is not None:
+                self.player.audio_set_volume(self.volume)
         except Exception:
             pass
 
@@ -141,12 +321,43 @@ class RadioApp(tk.Tk):
         super().__init__()
         self.title("Simple Radio")
         self.geometry("600x360")
-        self.stations = stations
+        # Stations are stored column-wise; keep the lists in sync via
+        # _add_station / _del_station / _edit_station.
+        self.names = [st.get("name", "") for st in stations]
+        self.infos = [st.get("info", "") for st in stations]
+        self.urls = [st.get("url", "") for st in stations]
+        # listbox display strings, formatted once (not saved)
+        self.labels = [self._station_label(n, i) for n, i in zip(self.names, self.infos)]
         self.player = RadioPlayer()
+        self.player.on_state = self._on_player_state
+        self._vol_after = None
+        self._save_after = None
+        self._last_hash = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._search_results = []
+        self.rb_base = RB_DEFAULT_HOST
+        threading.Thread(target=self._pick_rb_base, daemon=True).start()
 
         self._build_ui()
 
+    def _pick_rb_base(self):
+        self.rb_base = pick_rb_host()
+
+    def _rb_search_mode(self, query, mode):
+        host = self.rb_base
+        try:
+            return _rb_search(host, query, mode)
+        except Exception as e:
+            if host == RB_DEFAULT_HOST:
+                raise
+            # the chosen mirror is failing: use round-robin DNS for this
+            # search and pick another mirror for the following ones
+            print(f"[debug] mirror {host} failed: {e}")
+            if self.rb_base == host:
+                self.rb_base = RB_DEFAULT_HOST
+                threading.Thread(target=self._pick_rb_base, daemon=True).start()
+            return _rb_search(RB_DEFAULT_HOST, query, mode)
+
     def _build_ui(self):
         frm = ttk.Frame(self, padding=10)
         frm.pack(fill=tk.BOTH, expand=True)
@@ -167,6 +378,8 @@ class RadioApp(tk.Tk):
 
         self.search_btn = ttk.Button(search_frame, text="Search", command=self.on_search)
         self.search_btn.pack(side=tk.LEFT)
+        self.refresh_btn = ttk.Button(search_frame, text="Refresh", command=self.on_refresh)
+        self.refresh_btn.pack(side=tk.LEFT, padx=(6, 0))
 
         ttk.Label(frm, text="Stations").pack(anchor=tk.W)
         list_frame = ttk.Frame(frm)
@@ -178,10 +391,8 @@ class RadioApp(tk.Tk):
         self.station_scroll = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.listbox.yview)
         self.station_scroll.pack(side=tk.LEFT, fill=tk.Y)
         self.listbox.config(yscrollcommand=self.station_scroll.set)
-        for s in self.stations:
-            name = s.get("name", "(no name)")
-            info = s.get("info", "")
-            self.listbox.insert(tk.END, f"{name} - {info}")
+        # insert all rows in one Tcl call
+        self.listbox.insert(tk.END, *self.labels)
 
         btn_frame = ttk.Frame(list_frame)
         btn_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(8, 0))
@@ -236,7 +447,7 @@ class RadioApp(tk.Tk):
             messagebox.showinfo("Select station", "Please select a station first.")
             return
         idx = sel[0]
-        url = self.stations[idx].get("url")
+        url = self.urls[idx]
         if not url:
             messagebox.showinfo("No URL", "Station has no URL configured.")
             return
@@ -247,14 +458,32 @@ class RadioApp(tk.Tk):
 
     def _play_thread(self, url):
         self.player.play(url)
-        # after attempting to play, update status on main thread
-        self.after(100, lambda: self.status_var.set("Playing" if self.player.playing else "Stopped"))
+        # play() returns as soon as libvlc reports a state, so update right away
+        self.after(0, lambda: self.status_var.set("Playing" if self.player.playing else "Stopped"))
+
+    def _on_player_state(self, playing):
+        # Called from libvlc's event thread, which must never wait on Tk: the
+        # main thread may be inside player.stop(), which waits for this thread.
+        # Hand the after() call to a short-lived thread instead.
+        threading.Thread(
+            target=self.after,
+            args=(0, lambda: self.status_var.set("Playing" if playing else "Stopped")),
+            daemon=True,
+        ).start()
 
     def on_stop(self):
         self.player.stop()
         self.status_var.set("Stopped")
 
     def on_volume(self, v):
+        # The scale fires on every pixel of a drag; only apply the latest
+        # value once it has been stable for 30 ms.
+        if self._vol_after is not None:
+            self.after_cancel(self._vol_after)
+        self._vol_after = self.after(30, self._apply_volume, v)
+
+    def _apply_volume(self, v):
+        self._vol_after = None
         try:
             vol = int(float(v))
             self.player.set_volume(vol)
@@ -279,27 +508,70 @@ class RadioApp(tk.Tk):
             messagebox.showinfo("Delete station", "Please select a station first.")
             return
         idx = sel[0]
-        name = self.stations[idx].get("name", "(no name)")
+        name = self.names[idx] or "(no name)"
         if messagebox.askyesno("Delete", f"Delete station '{name}'?"):
             # stop if currently playing this
-            if self.player.current_url == self.stations[idx].get("url"):
+            if self.player.current_url == self.urls[idx]:
                 self.player.stop()
                 self.status_var.set("Stopped")
-            del self.stations[idx]
-            self.listbox.delete(idx)
+            self._del_station(idx)
             self.save_stations()
 
     def on_save(self):
-        self.save_stations()
+        self.save_stations(force=True)
         messagebox.showinfo("Saved", "stations.json saved")
 
-    def save_stations(self):
+    def save_stations(self, force=False):
+        if self._save_after is not None:
+            self.after_cancel(self._save_after)
+            self._save_after = None
         try:
-            with open(STATIONS_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.stations, f, ensure_ascii=False, indent=2)
+            stations = [{"name": n, "info": i, "url": u} for n, i, u in zip(self.names, self.infos, self.urls)]
+            data = json_dumps(stations, indent=True)
+            h = hashlib.blake2b(data, digest_size=8).digest()
+            if h == self._last_hash and not force:
+                return
+            write_file_atomic(STATIONS_FILE, data)
+            self._last_hash = h
         except Exception as e:
             messagebox.showerror("Save error", f"Failed to save stations.json: {e}")
 
+    def _schedule_save(self):
+        # collapse bursts of additions into a single write
+        if self._save_after is not None:
+            self.after_cancel(self._save_after)
+        self._save_after = self.after(500, self.save_stations)
+
+    def _on_close(self):
+        if self._save_after is not None:
+            self.save_stations()
+        self.destroy()
+
+    def _station_label(self, name, info):
+        return f"{name or '(no name)'} - {info}"
+
+    def _add_station(self, name, info, url):
+        self.names.append(name)
+        self.infos.append(info)
+        self.urls.append(url)
+        self.labels.append(self._station_label(name, info))
+        self.listbox.insert(tk.END, self.labels[-1])
+
+    def _del_station(self, i):
+        del self.names[i]
+        del self.infos[i]
+        del self.urls[i]
+        del self.labels[i]
+        self.listbox.delete(i)
+
+    def _edit_station(self, i, name, info, url):
+        self.names[i] = name
+        self.infos[i] = info
+        self.urls[i] = url
+        self.labels[i] = self._station_label(name, info)
+        self.listbox.delete(i)
+        self.listbox.insert(i, self.labels[i])
+
     def _open_station_editor(self, index: int | None = None):
         # If index is None -> add new, else edit existing
         win = tk.Toplevel(self)
@@ -308,39 +580,26 @@ class RadioApp(tk.Tk):
         frm = ttk.Frame(win, padding=10)
         frm.pack(fill=tk.BOTH, expand=True)
 
-        ttk.Label(frm, text="Name").pack(anchor=tk.W)
-        name_var = tk.StringVar(value=self.stations[index].get("name", "") if index is not None else "")
-        name_entry = ttk.Entry(frm, textvariable=name_var)
-        name_entry.pack(fill=tk.X)
-
-        ttk.Label(frm, text="Info").pack(anchor=tk.W, pady=(8, 0))
-        info_var = tk.StringVar(value=self.stations[index].get("info", "") if index is not None else "")
-        info_entry = ttk.Entry(frm, textvariable=info_var)
-        info_entry.pack(fill=tk.X)
-
-        ttk.Label(frm, text="Stream URL").pack(anchor=tk.W, pady=(8, 0))
-        url_var = tk.StringVar(value=self.stations[index].get("url", "") if index is not None else "")
-        url_entry = ttk.Entry(frm, textvariable=url_var)
-        url_entry.pack(fill=tk.X)
+        fields = [("Name", "name", self.names), ("Info", "info", self.infos), ("Stream URL", "url", self.urls)]
+        vars_ = {}
+        for label, key, values in fields:
+            ttk.Label(frm, text=label).pack(anchor=tk.W, pady=(8, 0) if vars_ else 0)
+            v = tk.StringVar(value=values[index] if index is not None else "")
+            ttk.Entry(frm, textvariable=v).pack(fill=tk.X)
+            vars_[key] = v
 
         btn_frm = ttk.Frame(frm)
         btn_frm.pack(fill=tk.X, pady=(12, 0))
 
         def on_ok():
-            name = name_var.get().strip()
-            info = info_var.get().strip()
-            url = url_var.get().strip()
+            name, info, url = (vars_[k].get().strip() for k in ("name", "info", "url"))
             if not name or not url:
                 messagebox.showinfo("Validation", "Name and URL are required.")
                 return
-            entry = {"name": name, "info": info, "url": url}
             if index is None:
-                self.stations.append(entry)
-                self.listbox.insert(tk.END, f"{name} - {info}")
+                self._add_station(name, info, url)
             else:
-                self.stations[index] = entry
-                self.listbox.delete(index)
-                self.listbox.insert(index, f"{name} - {info}")
+                self._edit_station(index, name, info, url)
             self.save_stations()
             win.destroy()
 
@@ -365,28 +624,21 @@ class RadioApp(tk.Tk):
         t = threading.Thread(target=self._search_thread, args=(query, mode), daemon=True)
         t.start()
 
+    def on_refresh(self):
+        # drop memoized results so the next search hits Radio Browser again
+        _rb_search.cache_clear()
+        self.on_search()
+
     def _search_thread(self, query, mode="Name"):
         try:
-            # build search modes list for fallback if Auto selected
-            modes = []
             if mode == "Auto":
-                modes = ["name", "tag", "country", "language"]
+                items = self._auto_search(query)
             else:
-                modes = [mode.lower()]
-
-            items = []
-            for m in modes:
-                params = {m: query, "limit": 50, "hidebroken": True}
                 try:
-                    r = requests.get("https://all.api.radio-browser.info/json/stations/search", params=params, timeout=10)
-                    r.raise_for_status()
-                    items = r.json()
+                    items = list(self._rb_search_mode(query, mode.lower()))
                 except Exception as e:
-                    # try next fallback mode
-                    print(f"[debug] search mode {m} failed: {e}")
+                    print(f"[debug] search mode {mode.lower()} failed: {e}")
                     items = []
-                if items:
-                    break
         except Exception as e:
             self.after(0, lambda: messagebox.showerror("Search error", f"Search failed: {e}"))
             items = []
@@ -398,13 +650,38 @@ class RadioApp(tk.Tk):
         except Exception:
             pass
 
+    def _auto_search(self, query):
+        # Run all modes concurrently on the pooled session, but keep the
+        # fallback priority: take the first mode (in order) with results.
+        modes = ["name", "tag", "country", "language"]
+        items = []
+        ex = ThreadPoolExecutor(max_workers=len(modes))
+        try:
+            futs = [(m, ex.submit(self._rb_search_mode, query, m)) for m in modes]
+            for m, fut in futs:
+                try:
+                    items = list(fut.result())
+                except Exception as e:
+                    # try next fallback mode
+                    print(f"[debug] search mode {m} failed: {e}")
+                    items = []
+                if items:
+                    break
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
+        return items
+
     def _display_search_results(self, items):
         self.results_listbox.delete(0, tk.END)
+        results = []
         for it in items:
-            name = it.get("name", "(no name)")
-            country = it.get("country", "")
-            url = it.get("url_resolved") or it.get("url") or ""
-            self.results_listbox.insert(tk.END, f"{name} [{country}] - {url}")
+            # memoized on the item, which is shared with the search LRU cache
+            label = it.get("_display")
+            if label is None:
+                label = f"{it['name']} [{it['country']}] - {it['url_resolved'] or it['url']}"
+                it["_display"] = label
+            results.append(label)
+        self.results_listbox.insert(tk.END, *results)
 
     def on_add_search(self):
         sel = self.results_listbox.curselection()
@@ -413,7 +690,7 @@ class RadioApp(tk.Tk):
             return
         idx = sel[0]
         item = self._search_results[idx]
-        url = item.get("url_resolved") or item.get("url") or ""
+        url = item["url_resolved"] or item["url"]
 
         # Resolve playlist in a background thread to avoid blocking the GUI
         try:
@@ -431,21 +708,19 @@ class RadioApp(tk.Tk):
                 print(f"[debug] add_search: resolving url={url}")
                 try:
                     # Use a shorter timeout to avoid long blocking on slow streams
-                    resolved = resolve_playlist(url, timeout=5)
+                    resolved = resolve_playlist(url, timeout=(2, 5))
                     print(f"[debug] resolve_playlist returned: {resolved}")
                 except Exception as e:
                     print(f"[debug] resolve_playlist failed: {e}")
                     resolved = url
 
-                entry = {"name": item.get("name", "(no name)"), "info": item.get("tags", ""), "url": resolved}
+                entry = {"name": item["name"], "info": item["tags"], "url": resolved}
 
                 def _finish():
                     try:
                         print(f"[debug] _finish: adding entry name={entry.get('name')} url={entry.get('url')}")
-                        self.stations.append(entry)
-                        self.listbox.insert(tk.END, f"{entry['name']} - {entry['info']}")
-                        self.save_stations()
-                        print("[debug] _finish: save_stations done")
+                        self._add_station(entry["name"], entry["info"], entry["url"])
+                        self._schedule_save()
                         try:
                             messagebox.showinfo("Added", f"Added station: {entry['name']}")
                         except Exception as e:
@@ -494,8 +769,15 @@ class RadioApp(tk.Tk):
 
 def main():
     stations = load_stations(STATIONS_FILE)
+    load_resolve_cache(RESOLVE_CACHE_FILE)
+    load_stream_hosts(STREAM_HOSTS_FILE)
     app = RadioApp(stations)
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        save_resolve_cache(RESOLVE_CACHE_FILE)
+        save_stream_hosts(STREAM_HOSTS_FILE)
+        SESSION.close()
 
 
 if __name__ == "__main__":